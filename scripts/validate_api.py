@@ -9,22 +9,32 @@ Usage:
     python validate_api.py                              # Auto-start server
     python validate_api.py --url http://localhost:3000  # Use existing server
     python validate_api.py --no-auto                    # Fail if server not running
+    python validate_api.py --no-cache                   # Reparse spec (skip cached copy)
 """
 
 import argparse
 import atexit
+import contextlib
+import functools
+import hashlib
 import json
 import os
-import shutil
+import pickle
+import re
 import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from typing import Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Sequence
 
-import requests
-import yaml
+# requests, yaml and the optional accelerators are imported where first
+# needed, so --help and argument errors don't pay for them
 
 # ANSI colors
 GREEN = "\033[92m"
@@ -33,26 +43,77 @@ YELLOW = "\033[93m"
 BLUE = "\033[94m"
 RESET = "\033[0m"
 
+# Number of schema errors reported per failed check
+MAX_ERRORS = 3
 
-def load_openapi_spec(spec_path: str) -> dict:
-    """Load and parse the OpenAPI specification."""
+# Logged by the server right before it binds its listener
+SERVER_STARTUP_LOG = b"Starting MIMDB server"
+
+
+def load_openapi_spec(spec_path: str, use_cache: bool = True) -> dict:
+    """Load and parse the OpenAPI specification.
+
+    The parsed spec is cached as a pickle in the temp directory, keyed by the
+    spec's path, mtime and size, so later runs can skip YAML parsing.
+    """
+    st = os.stat(spec_path)
+    path_hash = hashlib.sha1(os.path.realpath(spec_path).encode()).hexdigest()[:12]
+    cache = Path(tempfile.gettempdir()) / f"mimdb_spec_{path_hash}_{st.st_mtime_ns}_{st.st_size}.pkl"
+
+    # Only trust cache files written by the current user
+    if use_cache and cache.exists() and cache.stat().st_uid == os.getuid():
+        try:
+            with open(cache, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            pass  # Unreadable cache - reparse below
+
+    import yaml
+
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     with open(spec_path, "r") as f:
-        return yaml.safe_load(f)
+        spec = yaml.load(f, Loader=loader)
+
+    if use_cache:
+        # Write atomically so concurrent runs never see a partial file
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile("wb", dir=cache.parent, prefix=cache.stem, delete=False) as f:
+                tmp_name = f.name
+                pickle.dump(spec, f)
+            os.replace(tmp_name, cache)
+        except OSError:
+            if tmp_name:
+                with contextlib.suppress(OSError):
+                    os.unlink(tmp_name)
+        else:
+            # Drop caches left behind by earlier versions of this spec file
+            for stale in cache.parent.glob(f"mimdb_spec_{path_hash}_*.pkl"):
+                if stale != cache:
+                    with contextlib.suppress(OSError):
+                        stale.unlink()
+    return spec
+
 
+# OpenAPI type name -> Python type (integers are special-cased for bool)
+_TYPE_MAP = {"string": str, "integer": int, "boolean": bool, "array": list, "object": dict}
 
-def check_field_type(value: Any, expected_type: str, spec: dict) -> tuple[bool, str]:
+
+def check_field_type(value: Any, expected_type: str) -> tuple[bool, str]:
     """Check if a value matches the expected OpenAPI type."""
-    if expected_type == "string":
-        return isinstance(value, str), f"expected string, got {type(value).__name__}"
-    elif expected_type == "integer":
-        return isinstance(value, int) and not isinstance(value, bool), f"expected integer, got {type(value).__name__}"
-    elif expected_type == "boolean":
-        return isinstance(value, bool), f"expected boolean, got {type(value).__name__}"
-    elif expected_type == "array":
-        return isinstance(value, list), f"expected array, got {type(value).__name__}"
-    elif expected_type == "object":
-        return isinstance(value, dict), f"expected object, got {type(value).__name__}"
-    return True, ""
+    py_type = _TYPE_MAP.get(expected_type)
+    if py_type is None:
+        return True, ""
+
+    valid = isinstance(value, py_type)
+    if py_type is int and isinstance(value, bool):
+        valid = False
+    elif py_type is int and isinstance(value, float):
+        valid = value.is_integer()  # JSON Schema counts 1.0 as an integer
+    if valid:
+        return True, ""
+    return False, f"expected {expected_type}, got {type(value).__name__}"
 
 
 def resolve_ref(ref: str, spec: dict) -> dict:
@@ -64,140 +125,321 @@ def resolve_ref(ref: str, spec: dict) -> dict:
     return result
 
 
-def validate_response_schema(response_data: Any, schema: dict, spec: dict, path: str = "") -> list[str]:
-    """Validate response data against OpenAPI schema."""
-    errors = []
-
-    # Resolve $ref if present
+def schema_cost(schema: dict, resolve: Callable[[str], dict]) -> tuple[int, int]:
+    """Rough cost of walking a schema: scalars < arrays < objects, then required fields."""
     if "$ref" in schema:
-        schema = resolve_ref(schema["$ref"], spec)
-
-    # Handle oneOf - data must match at least one option
-    # Note: We allow multiple matches for ambiguous cases (e.g., empty arrays)
-    if "oneOf" in schema:
-        matching_options = []
-        all_errors = []
-        for i, option in enumerate(schema["oneOf"]):
-            option_errors = validate_response_schema(response_data, option, spec, path)
-            if not option_errors:
-                matching_options.append(i)
-            all_errors.extend(option_errors)
-
-        if len(matching_options) == 0:
-            errors.append(f"{path}: value doesn't match any oneOf option")
-            # Show first few errors from each option
-            for err in all_errors[:3]:
-                errors.append(f"  {err}")
-        # Allow multiple matches - JSON Schema oneOf is hard to enforce strictly
-        return errors
-
-    # Handle type checking
+        schema = resolve(schema["$ref"])
     schema_type = schema.get("type")
+    if schema_type == "object" or (
+        not schema_type and ("properties" in schema or isinstance(schema.get("required"), list))
+    ):
+        rank = 2
+    elif schema_type == "array":
+        rank = 1
+    else:
+        rank = 0
+    return rank, len(schema.get("required", []))
 
-    if schema_type == "array":
-        if not isinstance(response_data, list):
-            errors.append(f"{path}: expected array, got {type(response_data).__name__}")
-        else:
-            items_schema = schema.get("items", {})
-            for i, item in enumerate(response_data[:5]):  # Check first 5 items
-                errors.extend(validate_response_schema(item, items_schema, spec, f"{path}[{i}]"))
-
-    elif schema_type == "object" or (not schema_type and "properties" in schema):
-        # Treat as object if type is object OR if properties are defined
-        if not isinstance(response_data, dict):
-            errors.append(f"{path}: expected object, got {type(response_data).__name__}")
-        else:
-            # Check required fields - STRICT validation
-            required = schema.get("required", [])
-            for field in required:
-                # Convert camelCase to check both formats
-                if field not in response_data:
-                    errors.append(f"{path}: missing required field '{field}'")
 
-            # Check for unexpected null values in required fields
+def validate_response_schema(response_data: Any, schema: dict, resolve: Callable[[str], dict],
+                             path: str = "", max_errors: int = MAX_ERRORS) -> list[str]:
+    """Validate response data against OpenAPI schema.
+
+    `resolve` maps a $ref string to its schema (see APIValidator.resolve_ref).
+    Nodes are walked depth-first from an explicit stack of (data, schema, path);
+    the walk stops once `max_errors` errors have been collected.
+    """
+    errors = []
+    stack = deque([(response_data, schema, path)])
+
+    while stack and len(errors) < max_errors:
+        data, schema, path = stack.pop()
+
+        # Resolve $ref if present
+        if "$ref" in schema:
+            schema = resolve(schema["$ref"])
+
+        # Handle oneOf - data must match at least one option
+        # Note: We allow multiple matches for ambiguous cases (e.g., empty arrays),
+        # so the first matching option (cheapest first) settles it
+        if "oneOf" in schema:
+            remaining = max_errors - len(errors)
+            all_errors = []
+            for option in sorted(schema["oneOf"], key=lambda option: schema_cost(option, resolve)):
+                # Each option is walked on its own sub-stack so its errors stay local;
+                # it only gets what is left of the budget
+                option_errors = validate_response_schema(data, option, resolve, path, remaining)
+                if not option_errors:
+                    break
+                all_errors.extend(option_errors)
+            else:
+                errors.append(f"{path}: value doesn't match any oneOf option")
+                # Show first few errors from each option, within the remaining budget
+                for err in all_errors[:remaining - 1]:
+                    errors.append(f"  {err}")
+            # Allow multiple matches - JSON Schema oneOf is hard to enforce strictly
+            continue
+
+        if "enum" in schema and data not in schema["enum"]:
+            errors.append(f"{path}: {data!r} is not one of {schema['enum']}")
+
+        # Handle type checking
+        schema_type = schema.get("type")
+
+        # Children are pushed in reverse so they are popped in document order
+        if schema_type == "array":
+            if not isinstance(data, list):
+                errors.append(f"{path}: expected array, got {type(data).__name__}")
+            else:
+                items_schema = schema.get("items", {})
+                for i, item in reversed(list(enumerate(data))):
+                    stack.append((item, items_schema, f"{path}[{i}]"))
+
+        elif schema_type == "object" or (
+            not schema_type and ("properties" in schema or isinstance(schema.get("required"), list))
+        ):
+            # Treat as object if type is object OR if properties/required are defined
+            if not isinstance(data, dict):
+                errors.append(f"{path}: expected object, got {type(data).__name__}")
+            else:
+                # Check required fields - STRICT validation
+                required = schema.get("required", [])
+                for field in required:
+                    if field not in data:
+                        errors.append(f"{path}: missing required field '{field}'")
+
+                # Check for unexpected null values in required fields
+                for field in required:
+                    if field in data and data[field] is None:
+                        errors.append(f"{path}: required field '{field}' cannot be null")
+
+                # Check properties
+                properties = schema.get("properties", {})
+                present = [(name, prop) for name, prop in properties.items() if name in data]
+                for prop_name, prop_schema in reversed(present):
+                    stack.append((data[prop_name], prop_schema, f"{path}.{prop_name}"))
+
+        elif schema_type:
+            valid, msg = check_field_type(data, schema_type)
+            if not valid:
+                errors.append(f"{path}: {msg}")
+
+    # Object nodes may add several errors at once, so trim to the budget
+    return errors[:max_errors]
+
+
+@functools.cache
+def load_jsonschema_rs():
+    """Import jsonschema_rs on first use; None if missing or older than 0.20."""
+    try:
+        import jsonschema_rs
+    except ImportError:  # Optional - fall back to the built-in schema walker
+        return None
+    return jsonschema_rs if hasattr(jsonschema_rs, "validator_for") else None
+
+
+@functools.cache
+def load_json_decoder() -> Callable[[bytes | str], Any]:
+    """Return orjson.loads when installed, json.loads otherwise."""
+    try:
+        from orjson import loads
+    except ImportError:  # Optional - fall back to the stdlib decoder
+        return json.loads
+    return loads
+
+
+def to_json_schema(node: Any) -> Any:
+    """Convert an OpenAPI schema fragment into plain JSON Schema.
+
+    The result mirrors validate_response_schema: oneOf is relaxed to anyOf
+    (data may match several options, e.g. empty arrays), schemas with
+    properties/required but no type are objects, and required fields
+    cannot be null.
+    """
+    if isinstance(node, list):
+        return [to_json_schema(v) for v in node]
+    if not isinstance(node, dict):
+        return node
+
+    result = {("anyOf" if k == "oneOf" else k): to_json_schema(v) for k, v in node.items()}
+    required = node.get("required")
+    if "properties" in node or isinstance(required, list):
+        result.setdefault("type", "object")
+        if isinstance(required, list):
+            properties = result.setdefault("properties", {})
             for field in required:
-                if field in response_data and response_data[field] is None:
-                    errors.append(f"{path}: required field '{field}' cannot be null")
+                properties[field] = {"allOf": [properties.get(field, {}), {"not": {"type": "null"}}]}
+    return result
 
-            # Check properties
-            properties = schema.get("properties", {})
-            for prop_name, prop_schema in properties.items():
-                if prop_name in response_data:
-                    errors.extend(validate_response_schema(
-                        response_data[prop_name],
-                        prop_schema,
-                        spec,
-                        f"{path}.{prop_name}"
-                    ))
 
-    elif schema_type:
-        valid, msg = check_field_type(response_data, schema_type, spec)
-        if not valid:
-            errors.append(f"{path}: {msg}")
+def compile_schema(schema: dict, spec: dict):
+    """Compile a schema into a jsonschema_rs validator.
 
-    return errors
+    The spec components are embedded so that nested "#/components/..."
+    references resolve against the compiled document.
+    """
+    document = to_json_schema(schema)
+    document["components"] = to_json_schema(spec.get("components", {}))
+    return load_jsonschema_rs().validator_for(document)
+
+
+def format_error_path(instance_path: list, prefix: str = "") -> str:
+    """Render a jsonschema_rs instance path like validate_response_schema does."""
+    path = prefix
+    for part in instance_path:
+        path += f"[{part}]" if isinstance(part, int) else f".{part}"
+    return path
 
 
 class APIValidator:
-    def __init__(self, base_url: str, spec_path: str):
+    def __init__(self, base_url: str, spec_path: str, use_spec_cache: bool = True):
         self.base_url = base_url.rstrip("/")
-        self.spec = load_openapi_spec(spec_path)
+        self.spec = load_openapi_spec(spec_path, use_spec_cache)
         self.results = {"passed": 0, "failed": 0, "skipped": 0}
         self.test_table_id = None
         self.test_query_id = None
         self.test_select_query_id = None
-
-    def log(self, status: str, message: str):
+        # Temp CSV fixtures for COPY tests, removed when run_tests finishes
+        self.csv_fixtures: list[str] = []
+        self._cleanup = contextlib.ExitStack()
+        # Log lines are buffered and written once per section
+        self._logbuf: list[str] = []
+        # Per-thread buffers used by run_parallel workers
+        self._local = threading.local()
+        # Guards results and log buffers while checks run concurrently
+        self._lock = threading.Lock()
+
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # Reuse keep-alive connections across all endpoint checks
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+        # Compiled validators, keyed by (path, method, status or "request")
+        self._compiled = {}
+
+        # Each $ref is walked once; pre-warm with all component schemas
+        self.resolve_ref = functools.lru_cache(maxsize=None)(
+            functools.partial(resolve_ref, spec=self.spec)
+        )
+        for name in self.spec.get("components", {}).get("schemas", {}):
+            self.resolve_ref(f"#/components/schemas/{name}")
+
+        # One alternation maps concrete request paths back to their spec templates;
+        # the name of the matching group identifies the template
+        templates = [template for template in self.spec.get("paths", {}) if "{" in template]
+        self._group_to_template = {f"t{i}": template for i, template in enumerate(templates)}
+        patterns = [re.sub(r"\\\{[^}]+\\\}", "[^/]+", re.escape(template)) for template in templates]
+        self._path_re = re.compile(
+            "|".join(f"(?P<t{i}>{pattern})" for i, pattern in enumerate(patterns))
+            or "(?!)"  # Never matches when the spec has no templated paths
+        )
+
+        # Resolved (and, with jsonschema_rs, compiled) schemas for every operation
+        self._req_schema = {}
+        self._resp_schema = {}
+        self._build_schema_index()
+
+    def log(self, status: str, message: str, details: Sequence[str] = ()):
+        lines = []
         if status == "PASS":
-            print(f"  {GREEN}✓{RESET} {message}")
-            self.results["passed"] += 1
+            lines.append(f"  {GREEN}✓{RESET} {message}\n")
         elif status == "FAIL":
-            print(f"  {RED}✗{RESET} {message}")
-            self.results["failed"] += 1
+            lines.append(f"  {RED}✗{RESET} {message}\n")
         elif status == "SKIP":
-            print(f"  {YELLOW}○{RESET} {message}")
-            self.results["skipped"] += 1
+            lines.append(f"  {YELLOW}○{RESET} {message}\n")
         elif status == "INFO":
-            print(f"  {BLUE}ℹ{RESET} {message}")
+            lines.append(f"  {BLUE}ℹ{RESET} {message}\n")
+        lines.extend(f"      - {detail}\n" for detail in details)
+
+        buffer = getattr(self._local, "logbuf", self._logbuf)
+        with self._lock:
+            if status == "PASS":
+                self.results["passed"] += 1
+            elif status == "FAIL":
+                self.results["failed"] += 1
+            elif status == "SKIP":
+                self.results["skipped"] += 1
+            buffer.extend(lines)
+
+    def _flush_logs(self):
+        """Write all buffered log lines to stdout in one call."""
+        with self._lock:
+            sys.stdout.write("".join(self._logbuf))
+            sys.stdout.flush()
+            self._logbuf.clear()
+
+    def section(self, title: str):
+        """Flush the previous section's log lines and start a new section."""
+        self._flush_logs()
+        self._logbuf.append(f"\n{YELLOW}{title}{RESET}\n")
+
+    def run_parallel(self, checks: list[Callable[[], Any]]) -> list:
+        """Run independent checks concurrently, returning results in order.
+
+        Each check logs into its own buffer; buffers are merged in submission
+        order so the output does not depend on which check finished first.
+        """
+        def run(check):
+            self._local.logbuf = []
+            try:
+                return check(), self._local.logbuf
+            finally:
+                del self._local.logbuf
+
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            outcomes = list(executor.map(run, checks))
+
+        results = []
+        for result, lines in outcomes:
+            self._logbuf.extend(lines)
+            results.append(result)
+        return results
 
     def _test_default_values(self, csv_path: str, csv_with_header_path: str):
         """
         Test that OpenAPI default values work correctly.
         Per spec, doesCsvContainHeader defaults to false.
         """
-        # Test 1: Submit COPY without doesCsvContainHeader - should treat CSV as no-header
-        copy_no_flag = {
-            "queryDefinition": {
-                "sourceFilepath": csv_path,  # No header in this file
-                "destinationTableName": "compliance_test"
-                # doesCsvContainHeader omitted - should default to false
+        # Both COPYs are independent, so they are submitted concurrently
+        def copy_without_flag():
+            # Test 1: Submit COPY without doesCsvContainHeader - should treat CSV as no-header
+            copy_no_flag = {
+                "queryDefinition": {
+                    "sourceFilepath": csv_path,  # No header in this file
+                    "destinationTableName": "compliance_test"
+                    # doesCsvContainHeader omitted - should default to false
+                }
             }
-        }
-        try:
-            resp = requests.post(f"{self.base_url}/query", json=copy_no_flag, timeout=10)
-            if resp.status_code == 200:
-                self.log("PASS", "COPY without doesCsvContainHeader accepted (uses default)")
-            else:
-                self.log("FAIL", f"COPY without doesCsvContainHeader failed: {resp.status_code}")
-        except Exception as e:
-            self.log("FAIL", f"COPY default test request failed: {e}")
-
-        # Test 2: Submit COPY with explicit doesCsvContainHeader=true on header file
-        copy_with_header = {
-            "queryDefinition": {
-                "sourceFilepath": csv_with_header_path,  # Has header row
-                "destinationTableName": "compliance_test",
-                "doesCsvContainHeader": True  # Explicitly set
+            try:
+                resp = self.session.post(f"{self.base_url}/query", json=copy_no_flag, timeout=10)
+                if resp.status_code == 200:
+                    self.log("PASS", "COPY without doesCsvContainHeader accepted (uses default)")
+                else:
+                    self.log("FAIL", f"COPY without doesCsvContainHeader failed: {resp.status_code}")
+            except Exception as e:
+                self.log("FAIL", f"COPY default test request failed: {e}")
+
+        def copy_with_explicit_header():
+            # Test 2: Submit COPY with explicit doesCsvContainHeader=true on header file
+            copy_with_header = {
+                "queryDefinition": {
+                    "sourceFilepath": csv_with_header_path,  # Has header row
+                    "destinationTableName": "compliance_test",
+                    "doesCsvContainHeader": True  # Explicitly set
+                }
             }
-        }
-        try:
-            resp = requests.post(f"{self.base_url}/query", json=copy_with_header, timeout=10)
-            if resp.status_code == 200:
-                self.log("PASS", "COPY with doesCsvContainHeader=true accepted")
-            else:
-                self.log("FAIL", f"COPY with doesCsvContainHeader=true failed: {resp.status_code}")
-        except Exception as e:
-            self.log("FAIL", f"COPY with header test request failed: {e}")
+            try:
+                resp = self.session.post(f"{self.base_url}/query", json=copy_with_header, timeout=10)
+                if resp.status_code == 200:
+                    self.log("PASS", "COPY with doesCsvContainHeader=true accepted")
+                else:
+                    self.log("FAIL", f"COPY with doesCsvContainHeader=true failed: {resp.status_code}")
+            except Exception as e:
+                self.log("FAIL", f"COPY with header test request failed: {e}")
+
+        self.run_parallel([copy_without_flag, copy_with_explicit_header])
 
     def _validate_query_required_fields(self, query_response: dict, query_type: str):
         """
@@ -228,107 +470,122 @@ class APIValidator:
                 if "tableName" not in qdef:
                     self.log("FAIL", f"SELECT queryDefinition missing: 'tableName'")
 
-    def get_request_schema(self, path: str, method: str) -> dict | None:
-        """Get the expected request body schema from OpenAPI spec."""
-        path_spec = self.spec.get("paths", {}).get(path, {})
-        method_spec = path_spec.get(method.lower(), {})
-        request_body = method_spec.get("requestBody", {})
-
-        # Resolve $ref at request body level
-        if "$ref" in request_body:
-            request_body = resolve_ref(request_body["$ref"], self.spec)
+    def _json_schema(self, spec_object: dict) -> dict | None:
+        """Extract the resolved application/json schema of a requestBody or response."""
+        # Resolve $ref at requestBody/response level first
+        if "$ref" in spec_object:
+            spec_object = self.resolve_ref(spec_object["$ref"])
 
-        content = request_body.get("content", {})
+        content = spec_object.get("content", {})
         json_content = content.get("application/json", {})
         schema = json_content.get("schema")
 
         # Resolve $ref at schema level
         if schema and "$ref" in schema:
-            schema = resolve_ref(schema["$ref"], self.spec)
+            schema = self.resolve_ref(schema["$ref"])
 
         return schema
 
-    def get_schema_for_response(self, path: str, method: str, status_code: int) -> dict | None:
-        """Get the expected response schema from OpenAPI spec."""
-        path_spec = self.spec.get("paths", {}).get(path, {})
-        method_spec = path_spec.get(method.lower(), {})
-        responses = method_spec.get("responses", {})
-
-        # Try both int and string keys for status code
-        response_spec = responses.get(status_code, responses.get(str(status_code), {}))
-
-        # Resolve $ref at response level first
-        if "$ref" in response_spec:
-            response_spec = resolve_ref(response_spec["$ref"], self.spec)
-
-        content = response_spec.get("content", {})
-        json_content = content.get("application/json", {})
-        schema = json_content.get("schema")
+    def _build_schema_index(self):
+        """Flatten every request/response schema in the spec into lookup tables."""
+        for path, path_spec in self.spec.get("paths", {}).items():
+            for method, method_spec in path_spec.items():
+                if not isinstance(method_spec, dict) or "responses" not in method_spec:
+                    continue  # Path-level keys such as "parameters"
+                method = method.upper()
+
+                schema = self._json_schema(method_spec.get("requestBody", {}))
+                if schema:
+                    self._req_schema[(path, method)] = schema
+                    self._validator((path, method, "request"), schema)
+
+                for status_code, response_spec in method_spec["responses"].items():
+                    # YAML may yield int or string status keys
+                    status_code = int(status_code) if str(status_code).isdigit() else status_code
+                    schema = self._json_schema(response_spec)
+                    if schema:
+                        self._resp_schema[(path, method, status_code)] = schema
+                        self._validator((path, method, status_code), schema)
 
-        # Resolve $ref at schema level
-        if schema and "$ref" in schema:
-            schema = resolve_ref(schema["$ref"], self.spec)
+    def get_request_schema(self, path: str, method: str) -> dict | None:
+        """Get the expected request body schema from OpenAPI spec."""
+        return self._req_schema.get((path, method.upper()))
 
-        return schema
+    def get_schema_for_response(self, path: str, method: str, status_code: int) -> dict | None:
+        """Get the expected response schema from OpenAPI spec."""
+        return self._resp_schema.get((path, method.upper(), status_code))
+
+    def _validator(self, key: tuple, schema: dict):
+        """Get (compiling on first use) the validator for key, or None without jsonschema_rs."""
+        if load_jsonschema_rs() is None:
+            return None
+        validator = self._compiled.get(key)
+        if validator is None:
+            validator = self._compiled[key] = compile_schema(schema, self.spec)
+        return validator
+
+    def schema_errors(self, key: tuple, data: Any, schema: dict, path: str = "") -> list[str]:
+        """Validate data against a schema, using a cached compiled validator if available."""
+        validator = self._validator(key, schema)
+        if validator is None:
+            return validate_response_schema(data, schema, self.resolve_ref, path)
+
+        errors = []
+        for err in islice(validator.iter_errors(data), MAX_ERRORS):
+            if isinstance(err.kind, load_jsonschema_rs().ValidationErrorKind.Not) and err.instance_path:
+                # The only "not" is the one to_json_schema adds for required fields
+                parent = format_error_path(err.instance_path[:-1], path)
+                errors.append(f"{parent}: required field '{err.instance_path[-1]}' cannot be null")
+            else:
+                errors.append(f"{format_error_path(err.instance_path, path)}: {err.message}")
+        return errors
 
     def validate_endpoint(self, method: str, path: str, expected_status: int,
                           json_data: dict = None, description: str = "",
                           require_schema: bool = True) -> bool:
         """Test a single endpoint and validate response."""
+        import requests
+
         url = f"{self.base_url}{path}"
 
         # Validate request body against spec BEFORE sending
         if json_data and method in ("POST", "PUT", "PATCH"):
             request_schema = self.get_request_schema(path, method)
             if request_schema:
-                errors = validate_response_schema(json_data, request_schema, self.spec, "request")
+                errors = self.schema_errors((path, method, "request"), json_data, request_schema, "request")
                 if errors:
-                    self.log("FAIL", f"{method} {path}: request body doesn't match spec")
-                    for err in errors[:3]:
-                        print(f"      - {err}")
+                    self.log("FAIL", f"{method} {path}: request body doesn't match spec", errors[:MAX_ERRORS])
                     return False
 
         try:
-            if method == "GET":
-                resp = requests.get(url, json=json_data, timeout=5)
-            elif method == "POST":
-                resp = requests.post(url, json=json_data, timeout=5)
-            elif method == "PUT":
-                resp = requests.put(url, json=json_data, timeout=5)
-            elif method == "DELETE":
-                resp = requests.delete(url, timeout=5)
-            else:
+            if method not in ("GET", "POST", "PUT", "DELETE"):
                 self.log("SKIP", f"{method} {path} - unsupported method")
                 return False
 
+            resp = self.session.request(method, url, json=json_data, timeout=5)
+
             # Check status code
             if resp.status_code != expected_status:
                 self.log("FAIL", f"{method} {path}: expected {expected_status}, got {resp.status_code}")
                 return False
 
             # Validate response schema
-            if resp.text and resp.headers.get("content-type", "").startswith("application/json"):
+            if resp.content and resp.headers.get("content-type", "").startswith("application/json"):
                 try:
-                    response_data = resp.json()
+                    # Decode the raw bytes directly, skipping requests' text decoding
+                    response_data = load_json_decoder()(resp.content)
 
                     # Get expected schema
-                    # Normalize path for schema lookup (replace actual IDs with {param})
-                    schema_path = path
-                    if self.test_table_id and self.test_table_id in path:
-                        schema_path = path.replace(self.test_table_id, "{tableId}")
-                    if self.test_query_id and self.test_query_id in path:
-                        schema_path = path.replace(self.test_query_id, "{queryId}")
-                    if self.test_select_query_id and self.test_select_query_id in path:
-                        schema_path = path.replace(self.test_select_query_id, "{queryId}")
+                    # Normalize path for schema lookup (match against {param} templates)
+                    match = self._path_re.fullmatch(path)
+                    schema_path = self._group_to_template[match.lastgroup] if match else path
 
                     schema = self.get_schema_for_response(schema_path, method, expected_status)
 
                     if schema:
-                        errors = validate_response_schema(response_data, schema, self.spec)
+                        errors = self.schema_errors((schema_path, method, expected_status), response_data, schema)
                         if errors:
-                            self.log("FAIL", f"{method} {path}: schema validation failed")
-                            for err in errors[:3]:  # Show first 3 errors
-                                print(f"      - {err}")
+                            self.log("FAIL", f"{method} {path}: schema validation failed", errors[:MAX_ERRORS])
                             return False
                     elif require_schema:
                         self.log("FAIL", f"{method} {path}: no schema found in spec for {schema_path}")
@@ -348,21 +605,40 @@ class APIValidator:
             self.log("FAIL", f"{method} {path}: connection error - {e}")
             return False
 
+    def _write_csv_fixture(self, prefix: str, data: bytes) -> str:
+        """Write a CSV fixture to a unique temp file, tracked in csv_fixtures."""
+        fd, path = tempfile.mkstemp(prefix=prefix, suffix=".csv")
+        try:
+            # mkstemp uses 0600; the server reading the file may run as another user
+            os.fchmod(fd, 0o644)
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+        self.csv_fixtures.append(path)
+        return path
+
     def run_tests(self):
-        """Run all API compliance tests."""
+        """Run all API compliance tests, cleaning up temp fixtures afterwards."""
+        # atexit covers runs that die before the ExitStack unwinds
+        atexit.register(remove_files, self.csv_fixtures)
+        with self._cleanup:
+            self._cleanup.callback(remove_files, self.csv_fixtures)
+            self._cleanup.callback(self._flush_logs)
+            return self._run_tests()
+
+    def _run_tests(self):
         print(f"\n{BLUE}═══════════════════════════════════════════════════════════════{RESET}")
         print(f"{BLUE}  MIMDB API Compliance Validator{RESET}")
         print(f"{BLUE}═══════════════════════════════════════════════════════════════{RESET}")
         print(f"  Target: {self.base_url}")
         print(f"  Spec:   dbmsInterface.yaml v{self.spec['info']['version']}")
-        print()
 
         # Test 1: System Info
-        print(f"{YELLOW}[1/8] System Information{RESET}")
+        self.section("[1/8] System Information")
         self.validate_endpoint("GET", "/system/info", 200, description="- uptime, version, author")
 
         # Test 2: Tables - Empty List
-        print(f"\n{YELLOW}[2/8] Table Operations{RESET}")
+        self.section("[2/8] Table Operations")
         self.validate_endpoint("GET", "/tables", 200, description="- list tables (empty)")
 
         # Test 3: Create Table
@@ -386,20 +662,18 @@ class APIValidator:
         self.validate_endpoint("GET", "/tables", 200, description="- list tables (with data)")
 
         # Test 6: Query Operations
-        print(f"\n{YELLOW}[3/8] Query Operations{RESET}")
+        self.section("[3/8] Query Operations")
         self.validate_endpoint("GET", "/queries", 200, description="- list queries (empty)")
 
         # Create CSV files for COPY tests
-        csv_path = "/tmp/compliance_test.csv"
-        with open(csv_path, "w") as f:
-            f.write("1,Alice\n2,Bob\n3,Charlie\n")
-
-        csv_with_header_path = "/tmp/compliance_test_header.csv"
-        with open(csv_with_header_path, "w") as f:
-            f.write("id,name\n10,HeaderTest1\n20,HeaderTest2\n")
+        # (unique per run, so parallel validator runs don't clobber each other)
+        csv_path = self._write_csv_fixture("compliance_test_", b"1,Alice\n2,Bob\n3,Charlie\n")
+        csv_with_header_path = self._write_csv_fixture(
+            "compliance_test_header_", b"id,name\n10,HeaderTest1\n20,HeaderTest2\n"
+        )
 
         # Test 7: COPY Query with explicit doesCsvContainHeader=False
-        print(f"\n{YELLOW}[4/8] COPY Query{RESET}")
+        self.section("[4/8] COPY Query")
         copy_query = {
             "queryDefinition": {
                 "sourceFilepath": csv_path,
@@ -419,11 +693,11 @@ class APIValidator:
                 self._validate_query_required_fields(result, "COPY")
 
         # Test: Default value for doesCsvContainHeader (should default to false)
-        print(f"\n{YELLOW}[4b/8] Default Value Tests{RESET}")
+        self.section("[4b/8] Default Value Tests")
         self._test_default_values(csv_path, csv_with_header_path)
 
         # Test 9: SELECT Query
-        print(f"\n{YELLOW}[5/8] SELECT Query{RESET}")
+        self.section("[5/8] SELECT Query")
         select_query = {
             "queryDefinition": {
                 "tableName": "compliance_test"
@@ -441,28 +715,36 @@ class APIValidator:
                 self._validate_query_required_fields(result, "SELECT")
 
         # Test 10: Get Query Result
-        print(f"\n{YELLOW}[6/8] Query Results{RESET}")
+        self.section("[6/8] Query Results")
+        checks = []
         if self.test_select_query_id:
-            self.validate_endpoint("GET", f"/result/{self.test_select_query_id}", 200, description="- get SELECT result")
+            checks.append(functools.partial(
+                self.validate_endpoint, "GET", f"/result/{self.test_select_query_id}", 200,
+                description="- get SELECT result"
+            ))
 
         # Test 11: List Queries (non-empty)
-        self.validate_endpoint("GET", "/queries", 200, description="- list queries (with data)")
+        checks.append(functools.partial(
+            self.validate_endpoint, "GET", "/queries", 200, description="- list queries (with data)"
+        ))
+        self.run_parallel(checks)
 
         # Test 12: Error Cases
-        print(f"\n{YELLOW}[7/8] Error Handling{RESET}")
-        self.validate_endpoint("GET", "/table/nonexistent-id", 404, description="- table not found", require_schema=False)
-        self.validate_endpoint("GET", "/query/nonexistent-id", 404, description="- query not found", require_schema=False)
+        self.section("[7/8] Error Handling")
+        self.run_parallel([
+            functools.partial(self.validate_endpoint, "GET", "/table/nonexistent-id", 404,
+                              description="- table not found", require_schema=False),
+            functools.partial(self.validate_endpoint, "GET", "/query/nonexistent-id", 404,
+                              description="- query not found", require_schema=False),
+        ])
 
         # Test 13: Cleanup
-        print(f"\n{YELLOW}[8/8] Cleanup{RESET}")
+        self.section("[8/8] Cleanup")
         if self.test_table_id:
             self.validate_endpoint("DELETE", f"/table/{self.test_table_id}", 200, description="- delete table")
 
-        # Cleanup temp file
-        if os.path.exists(csv_path):
-            os.remove(csv_path)
-
         # Summary
+        self._flush_logs()
         print(f"\n{BLUE}═══════════════════════════════════════════════════════════════{RESET}")
         total = self.results["passed"] + self.results["failed"] + self.results["skipped"]
         print(f"  {GREEN}Passed:{RESET}  {self.results['passed']}")
@@ -482,6 +764,7 @@ class ServerManager:
         self.process = None
         self.data_dir = None
         self.server_binary = None
+        self.session = None
 
     def find_server_binary(self) -> str | None:
         """Find the server binary in common locations."""
@@ -537,18 +820,33 @@ class ServerManager:
                 [self.server_binary, "--data-dir", self.data_dir, "--port", str(self.port)],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                preexec_fn=os.setsid  # Create new process group for clean shutdown
+                start_new_session=True  # New session (and process group) for clean shutdown
             )
 
-            # Wait for server to be ready
-            for i in range(30):  # 3 seconds max
-                time.sleep(0.1)
+            # Wait for the startup log line, then probe - 3 seconds max in total
+            deadline = time.monotonic() + 3.0
+            started = threading.Event()
+            threading.Thread(target=self._watch_stdout, args=(started,), daemon=True).start()
+            started.wait(timeout=3.0)
+
+            # The line precedes the bind, so confirm with exponential backoff probes
+            # (at least one, in case the log line never showed up)
+            import requests
+            self.session = requests.Session()
+            delay = 0.005
+            while self.process.poll() is None:
+                remaining = deadline - time.monotonic()
                 try:
-                    resp = requests.get(f"http://localhost:{self.port}/system/info", timeout=1)
+                    resp = self.session.get(f"{self.url}/system/info", timeout=max(min(remaining, 1.0), 0.1))
                     if resp.status_code == 200:
                         return True
                 except requests.RequestException:
                     pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.2)
 
             print(f"  {RED}✗{RESET} Server failed to start within timeout")
             self.stop()
@@ -558,6 +856,13 @@ class ServerManager:
             print(f"  {RED}✗{RESET} Failed to start server: {e}")
             return False
 
+    def _watch_stdout(self, started: threading.Event):
+        """Signal once the server logs its startup line, then keep draining stdout."""
+        for line in self.process.stdout:
+            if SERVER_STARTUP_LOG in line:
+                started.set()
+        started.set()  # Server exited - nothing left to wait for
+
     def stop(self):
         """Stop the server and cleanup."""
         if self.process:
@@ -575,7 +880,7 @@ class ServerManager:
         # Cleanup data directory
         if self.data_dir and os.path.exists(self.data_dir):
             try:
-                shutil.rmtree(self.data_dir)
+                fast_rmtree(self.data_dir)
             except Exception:
                 pass
             self.data_dir = None
@@ -585,6 +890,32 @@ class ServerManager:
         return f"http://localhost:{self.port}"
 
 
+def remove_files(paths: list[str]):
+    """Remove files, ignoring any that are already gone."""
+    for path in paths:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(path)
+
+
+def fast_rmtree(path: str):
+    """Remove a directory tree, unlinking its files concurrently."""
+    files, dirs = [], [path]
+    # Collect everything first; dirs are listed parents-before-children
+    for directory in dirs:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                else:
+                    files.append(entry.path)
+
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(os.unlink, files))
+
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
 def find_spec_file() -> str | None:
     """Find the OpenAPI spec file."""
     possible_paths = [
@@ -608,14 +939,18 @@ Examples:
   python validate_api.py --url http://localhost:3000  # Use existing server
   python validate_api.py --port 3001                  # Auto-start on different port
   python validate_api.py --no-auto                    # Fail if server not running
+  python validate_api.py --no-cache                   # Reparse spec (skip cached copy)
         """
     )
     parser.add_argument("--url", default=None, help="Base URL of existing API server (skips auto-start)")
     parser.add_argument("--port", type=int, default=3000, help="Port for auto-started server (default: 3000)")
     parser.add_argument("--spec", default=None, help="Path to OpenAPI spec file")
     parser.add_argument("--no-auto", action="store_true", help="Don't auto-start server")
+    parser.add_argument("--no-cache", action="store_true", help="Always parse the spec instead of using the cached copy")
     args = parser.parse_args()
 
+    import requests
+
     # Find spec file
     spec_path = args.spec or find_spec_file()
     if not spec_path:
@@ -663,7 +998,7 @@ Examples:
 
     # Run validation
     print()
-    validator = APIValidator(base_url, spec_path)
+    validator = APIValidator(base_url, spec_path, use_spec_cache=not args.no_cache)
     success = validator.run_tests()
 
     # Cleanup